@@ -1,10 +1,13 @@
 import pygame
 import json
+import math
+import bisect
 import os
+import re
 import argparse
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
-from dataclasses import dataclass
+from typing import Dict, FrozenSet, List, Tuple, Optional
+from dataclasses import dataclass, field
 from enum import Enum
 
 # Initialize Pygame
@@ -14,7 +17,13 @@ pygame.init()
 SCREEN_WIDTH = 1280
 SCREEN_HEIGHT = 720
 TILE_SIZE = 16
+# Size in pixels of the pre-rendered tile pages the level is drawn from
+TILE_PAGE_SIZE = 512
+# Size in pixels of the buckets collectibles are indexed by for pickup checks
+COLLECTIBLE_CELL_SIZE = 64
 FPS = 60
+# Most fixed physics steps run before a frame is drawn when the game falls behind
+MAX_UPDATES_PER_FRAME = 5
 GRAVITY = 0.5
 MAX_FALL_SPEED = 10
 # Fraction of the viewport height where the player's feet sit within the view.
@@ -22,6 +31,15 @@ CAMERA_VERTICAL_TRIGGER_FRACTION = 0.8
 # Fractional deadzone above/below the trigger where the camera does not move.
 CAMERA_VERTICAL_DEADZONE_UP_FRACTION = 0.5
 CAMERA_VERTICAL_DEADZONE_DOWN_FRACTION = 0.08
+# Band of the viewport (as fractions of its height) the player's feet may move in freely
+CAMERA_MIN_SCREEN_FRACTION = max(0.0, CAMERA_VERTICAL_TRIGGER_FRACTION - CAMERA_VERTICAL_DEADZONE_UP_FRACTION)
+CAMERA_MAX_SCREEN_FRACTION = min(1.0, CAMERA_VERTICAL_TRIGGER_FRACTION + CAMERA_VERTICAL_DEADZONE_DOWN_FRACTION)
+
+# Movement keys read by Player.update every frame
+K_LEFT, K_A = pygame.K_LEFT, pygame.K_a
+K_RIGHT, K_D = pygame.K_RIGHT, pygame.K_d
+K_UP, K_W = pygame.K_UP, pygame.K_w
+K_DOWN, K_S = pygame.K_DOWN, pygame.K_s
 
 # Colors
 WHITE = (255, 255, 255)
@@ -41,6 +59,27 @@ class TileProperty(Enum):
     END_LEVEL = "end_level"
     PLAYER_START = "player_start"
 
+# Bit flags for tile properties, packed into TileType.prop_mask
+SOLID_BIT = 1
+PLATFORM_BIT = 2
+BREAKABLE_BIT = 4
+HAZARD_BIT = 8
+BACKGROUND_BIT = 16
+LADDER_BIT = 32
+END_LEVEL_BIT = 64
+PLAYER_START_BIT = 128
+
+PROPERTY_BITS = {
+    TileProperty.SOLID.value: SOLID_BIT,
+    TileProperty.PLATFORM.value: PLATFORM_BIT,
+    TileProperty.BREAKABLE.value: BREAKABLE_BIT,
+    TileProperty.HAZARD.value: HAZARD_BIT,
+    TileProperty.BACKGROUND.value: BACKGROUND_BIT,
+    TileProperty.LADDER.value: LADDER_BIT,
+    TileProperty.END_LEVEL.value: END_LEVEL_BIT,
+    TileProperty.PLAYER_START.value: PLAYER_START_BIT,
+}
+
 # Enemy AI Types
 class EnemyAI(Enum):
     STATIONARY = "stationary"
@@ -49,6 +88,16 @@ class EnemyAI(Enum):
     FLYING = "flying"
     SHOOTER = "shooter"
 
+# Integer AI codes so the per-frame dispatch compares ints instead of strings
+AI_STATIONARY, AI_PATROL, AI_CHASE, AI_FLYING, AI_SHOOTER = range(5)
+AI_CODES = {
+    EnemyAI.STATIONARY.value: AI_STATIONARY,
+    EnemyAI.PATROL.value: AI_PATROL,
+    EnemyAI.CHASE.value: AI_CHASE,
+    EnemyAI.FLYING.value: AI_FLYING,
+    EnemyAI.SHOOTER.value: AI_SHOOTER,
+}
+
 # Collectible Types
 class CollectibleEffect(Enum):
     HEALTH = "health"
@@ -63,19 +112,59 @@ class GameState(Enum):
     GAME_OVER = "game_over"
     HIGH_SCORES = "high_scores"
 
-@dataclass
+def convert_surface(surface: pygame.Surface) -> pygame.Surface:
+    """Convert a surface to the display's pixel format so blits take the fast path.
+
+    Returns the surface unchanged if no display mode has been set yet.
+    """
+    if pygame.display.get_surface() is None:
+        return surface
+    if surface.get_flags() & pygame.SRCALPHA:
+        return surface.convert_alpha()
+    return surface.convert()
+
+# Tile-sized images keyed by file path, shared by every type and level that uses them
+_tile_image_cache: Dict[str, pygame.Surface] = {}
+
+def load_tile_image(path: str) -> pygame.Surface:
+    """Load an image scaled to TILE_SIZE, reusing the surface if the path was loaded before"""
+    image = _tile_image_cache.get(path)
+    if image is None:
+        image = pygame.image.load(path)
+        image = convert_surface(pygame.transform.scale(image, (TILE_SIZE, TILE_SIZE)))
+        _tile_image_cache[path] = image
+    return image
+
+def seek_velocity(dx: float, dy: float, speed: float) -> Tuple[float, float, float]:
+    """Get (vel_x, vel_y, distance) for moving at speed towards an offset of (dx, dy)"""
+    distance = math.sqrt(dx * dx + dy * dy)
+    if distance <= 0:
+        return 0.0, 0.0, distance
+    # Scale the offset straight to speed rather than normalising each axis separately
+    scale = speed / distance
+    return dx * scale, dy * scale, distance
+
+@dataclass(slots=True)
 class TileType:
     id: int
     name: str
     image_path: Optional[str]
     image: Optional[pygame.Surface]
-    properties: List[str]
+    properties: FrozenSet[str]
     color: Tuple[int, int, int]
+    prop_mask: int = field(init=False, default=0)  # Property bit flags derived from properties
+    fill_surface: Optional[pygame.Surface] = field(init=False, default=None)  # Solid-colour tile for image-less types
 
-@dataclass
+    def __post_init__(self):
+        self.prop_mask = 0
+        for prop in self.properties:
+            self.prop_mask |= PROPERTY_BITS.get(prop, 0)
+
+@dataclass(slots=True)
 class Tile:
     tile_type_id: int
     layer: str
+    tile_type: Optional[TileType] = None  # Resolved from tile_type_id at load time
 
 @dataclass
 class EnemyType:
@@ -94,6 +183,11 @@ class EnemyType:
     projectile_speed: float = 4.0  # Speed of projectiles for SHOOTER AI
     fire_rate: int = 120  # Cooldown frames between shots for SHOOTER AI
     projectile_damage: int = 1  # Damage dealt by projectiles for SHOOTER AI
+    fill_surface: Optional[pygame.Surface] = field(init=False, default=None)  # Solid-colour sprite for image-less types
+    ai_code: int = field(init=False, default=AI_STATIONARY)  # Derived from ai_type (unknown types don't move)
+
+    def __post_init__(self):
+        self.ai_code = AI_CODES.get(self.ai_type, AI_STATIONARY)
 
 @dataclass
 class CollectibleType:
@@ -105,6 +199,7 @@ class CollectibleType:
     value: int
     color: Tuple[int, int, int]
     required: bool = False
+    fill_surface: Optional[pygame.Surface] = field(init=False, default=None)  # Coloured disc for image-less types
 
 @dataclass
 class BackgroundImage:
@@ -119,46 +214,79 @@ class BackgroundImage:
     repeat_y: bool
     parallax_factor: float  # 1.0 = moves with tiles, <1.0 = slower, >1.0 = faster
     is_foreground: bool = False  # If True, renders in front of tiles/player
+    scaled_image: Optional[pygame.Surface] = field(init=False, default=None)  # image at width x height, built at load
+    tiled_surface: Optional[pygame.Surface] = field(init=False, default=None)  # Repeats of scaled_image, built on first draw
 
 class Player:
+    # Fixed attribute set: slots make the per-frame attribute reads and writes cheaper
+    __slots__ = (
+        'x', 'y', 'width', 'height', 'vel_x', 'vel_y', 'cx', 'cy', '_rect',
+        'on_ground', 'on_ladder', 'climbing', 'fall_through_platform',
+        'speed', 'jump_strength', 'health', 'max_health',
+        'attacking', 'attack_timer', 'attack_duration', 'attack_cooldown',
+        'attack_cooldown_timer', 'attack_damage', 'attack_range',
+        'facing_right', 'animation_frame', 'animation_timer', 'animation_speed',
+        'sprite_frames', 'sprite_frames_left', 'slash_frames', 'slash_frames_left', 'slash_offsets',
+    )
+
     def __init__(self, x: float, y: float):
-        self.x = x
-        self.y = y
         self.width = 14
         self.height = 28
-        self.vel_x = 0
-        self.vel_y = 0
-        self.on_ground = False
-        self.on_ladder = False
-        self.climbing = False
-        self.fall_through_platform = False  # Track intentional platform fall-through
+        self._rect = pygame.Rect(0, 0, self.width, self.height)  # Reused by get_rect
 
         # Player stats
         self.speed = 3
         self.jump_strength = 10
-        self.health = 100
         self.max_health = 100
 
         # Attack
-        self.attacking = False
-        self.attack_timer = 0
         self.attack_duration = 10  # frames
         self.attack_cooldown = 20  # frames
-        self.attack_cooldown_timer = 0
         self.attack_damage = 25
         self.attack_range = 35
 
         # Animation
-        self.facing_right = True
-        self.animation_frame = 0
-        self.animation_timer = 0
         self.animation_speed = 6
         self.sprite_frames = self.build_placeholder_sprites()
         self.slash_frames = self.build_placeholder_slash()
+        # Mirrored copies for facing left, so draw never flips a surface
+        self.sprite_frames_left = {
+            state: [pygame.transform.flip(frame, True, False) for frame in frames]
+            for state, frames in self.sprite_frames.items()
+        }
+        self.slash_frames_left = [pygame.transform.flip(frame, True, False) for frame in self.slash_frames]
         self.slash_offsets = [(10, -6), (14, -2), (12, 2)]
-        
+
+        self.reset(x, y)
+
+    def reset(self, x: float, y: float):
+        """Put the player back to a fresh spawn at (x, y), keeping the built sprite frames"""
+        self.x = x
+        self.y = y
+        self.vel_x = 0
+        self.vel_y = 0
+        self.on_ground = False
+        self.on_ladder = False
+        self.climbing = False
+        self.fall_through_platform = False  # Track intentional platform fall-through
+        # Centre point, published once per update for enemies to aim at
+        self.cx = self.x + self.width / 2
+        self.cy = self.y + self.height / 2
+        self.health = self.max_health
+
+        self.attacking = False
+        self.attack_timer = 0
+        self.attack_cooldown_timer = 0
+
+        self.facing_right = True
+        self.animation_frame = 0
+        self.animation_timer = 0
+
     def get_rect(self) -> pygame.Rect:
-        return pygame.Rect(int(self.x), int(self.y), self.width, self.height)
+        """Get the player's hitbox (the same Rect is updated in place on every call)"""
+        self._rect.x = int(self.x)
+        self._rect.y = int(self.y)
+        return self._rect
 
     def get_attack_rect(self) -> pygame.Rect:
         """Get the hitbox for the sword swing"""
@@ -195,23 +323,28 @@ class Player:
 
     def update(self, keys, level):
         """Update player physics and movement"""
+        left = keys[K_LEFT] or keys[K_A]
+        right = keys[K_RIGHT] or keys[K_D]
+        up = keys[K_UP] or keys[K_W]
+        down = keys[K_DOWN] or keys[K_S]
+
         # Horizontal movement
         self.vel_x = 0
-        if keys[pygame.K_LEFT] or keys[pygame.K_a]:
+        if left:
             self.vel_x = -self.speed
             self.facing_right = False
             self.climbing = False
-        elif keys[pygame.K_RIGHT] or keys[pygame.K_d]:
+        elif right:
             self.vel_x = self.speed
             self.facing_right = True
             self.climbing = False
         
         # Climbing
         if self.on_ladder:
-            if keys[pygame.K_UP] or keys[pygame.K_w]:
+            if up:
                 self.climbing = True
                 self.vel_y = -self.speed
-            elif keys[pygame.K_DOWN] or keys[pygame.K_s]:
+            elif down:
                 self.climbing = True
                 self.vel_y = self.speed
             else:
@@ -219,11 +352,11 @@ class Player:
                     self.vel_y = 0
         
         # Jumping (removed spacebar - now used for attack)
-        if (keys[pygame.K_UP] or keys[pygame.K_w]) and self.on_ground and not self.on_ladder:
+        if up and self.on_ground and not self.on_ladder:
             self.vel_y = -self.jump_strength
             self.on_ground = False
             # Set fall-through flag if down is pressed while jumping
-            if keys[pygame.K_DOWN] or keys[pygame.K_s]:
+            if down:
                 self.fall_through_platform = True
             else:
                 self.fall_through_platform = False
@@ -249,6 +382,9 @@ class Player:
         # Check for hazards
         self.check_hazards(level)
 
+        self.cx = self.x + self.width / 2
+        self.cy = self.y + self.height / 2
+
         # Update attack timers
         if self.attacking:
             self.attack_timer -= 1
@@ -295,11 +431,11 @@ class Player:
             "attack": [],
         }
         for frame in range(2):
-            base["idle"].append(self.render_placeholder_frame("idle", frame))
+            base["idle"].append(convert_surface(self.render_placeholder_frame("idle", frame)))
         for frame in range(4):
-            base["run"].append(self.render_placeholder_frame("run", frame))
+            base["run"].append(convert_surface(self.render_placeholder_frame("run", frame)))
         for frame in range(3):
-            base["attack"].append(self.render_placeholder_frame("attack", frame))
+            base["attack"].append(convert_surface(self.render_placeholder_frame("attack", frame)))
         return base
 
     def render_placeholder_frame(self, state, frame):
@@ -404,104 +540,157 @@ class Player:
                 pygame.draw.line(surface, (200, 220, 255, alpha // 2), (4, y_center - 2), (width - 4, y_center + 1), 2)
                 pygame.draw.line(surface, (200, 220, 255, alpha // 2), (4, y_center + 2), (width - 4, y_center - 1), 2)
 
-            slash_frames.append(surface)
+            slash_frames.append(convert_surface(surface))
         return slash_frames
 
+    def get_tile_span(self) -> Tuple[int, int, int, int]:
+        """Get the inclusive tile ranges (x0, y0, x1, y1) covered by the player's rect"""
+        left = int(self.x)
+        top = int(self.y)
+        return (
+            left // TILE_SIZE,
+            top // TILE_SIZE,
+            (left + self.width - 1) // TILE_SIZE,
+            (top + self.height - 1) // TILE_SIZE
+        )
+
     def handle_horizontal_collisions(self, level):
         """Handle collisions in the X direction"""
-        player_rect = self.get_rect()
-        
-        for (tile_x, tile_y), tile in level.get_solid_tiles():
-            tile_rect = pygame.Rect(tile_x * TILE_SIZE, tile_y * TILE_SIZE, TILE_SIZE, TILE_SIZE)
-            
-            if player_rect.colliderect(tile_rect):
-                # Push player out
-                if self.vel_x > 0:  # Moving right
-                    self.x = tile_rect.left - self.width
-                elif self.vel_x < 0:  # Moving left
-                    self.x = tile_rect.right
-                self.vel_x = 0
+        if self.vel_x == 0:
+            return  # Not moving sideways, so there is nothing to push out of
+
+        # Only tiles under the player's rect can collide, so look them up directly
+        tile_x0, tile_y0, tile_x1, tile_y1 = self.get_tile_span()
+        prop_grid = level.prop_grid
+        level_width = level.width
+        first_row = max(tile_y0, 0)
+        last_row = min(tile_y1, level.height - 1)
+
+        # Resolve against the nearest column first in the direction of travel
+        columns = range(max(tile_x0, 0), min(tile_x1, level_width - 1) + 1)
+        if self.vel_x < 0:
+            columns = reversed(columns)
+
+        for tile_x in columns:
+            # Step down the column one grid row at a time
+            for index in range(first_row * level_width + tile_x,
+                               last_row * level_width + tile_x + 1, level_width):
+                if prop_grid[index] & SOLID_BIT:
+                    # Push player out
+                    if self.vel_x > 0:  # Moving right
+                        self.x = tile_x * TILE_SIZE - self.width
+                    elif self.vel_x < 0:  # Moving left
+                        self.x = (tile_x + 1) * TILE_SIZE
+                    self.vel_x = 0
+                    return
     
     def handle_vertical_collisions(self, level, previous_y):
         """Handle collisions in the Y direction"""
-        player_rect = self.get_rect()
+        tile_x0, tile_y0, tile_x1, tile_y1 = self.get_tile_span()
+        player_bottom = int(self.y) + self.height
         self.on_ground = False
         self.on_ladder = False
-        
-        # Check for ladders
-        for (tile_x, tile_y), tile_type in level.get_ladder_tiles():
-            tile_rect = pygame.Rect(tile_x * TILE_SIZE, tile_y * TILE_SIZE, TILE_SIZE, TILE_SIZE)
-            if player_rect.colliderect(tile_rect):
-                self.on_ladder = True
-        
-        # Check solid tiles
-        for (tile_x, tile_y), tile in level.get_solid_tiles():
-            tile_rect = pygame.Rect(tile_x * TILE_SIZE, tile_y * TILE_SIZE, TILE_SIZE, TILE_SIZE)
-            
-            if player_rect.colliderect(tile_rect):
-                if self.vel_y > 0:  # Falling down
-                    self.y = tile_rect.top - self.height
-                    self.vel_y = 0
-                    self.on_ground = True
-                    self.climbing = False
-                    self.fall_through_platform = False  # Clear flag when landing on solid ground
-                elif self.vel_y < 0:  # Moving up
-                    self.y = tile_rect.bottom
-                    self.vel_y = 0
-        
-        # Check platform tiles (only from above)
+
+        # Platforms only catch the player while falling onto them from above
+        # Skip them if player pressed down+jump to intentionally fall through
         previous_bottom = previous_y + self.height
         platform_tolerance = 2  # Small tolerance for floating point precision
-
-        for (tile_x, tile_y), tile in level.get_platform_tiles():
-            tile_rect = pygame.Rect(tile_x * TILE_SIZE, tile_y * TILE_SIZE, TILE_SIZE, TILE_SIZE)
-
-            # Only collide if falling and not intentionally falling through
-            # Skip collision if player pressed down+jump to intentionally fall through
-            if self.vel_y > 0 and not self.fall_through_platform:
-                horizontal_overlap = (
-                    player_rect.right > tile_rect.left
-                    and player_rect.left < tile_rect.right
+        check_platforms = self.vel_y > 0 and not self.fall_through_platform
+        last_row = tile_y1
+        if check_platforms:
+            last_row = max(last_row, (player_bottom + platform_tolerance) // TILE_SIZE)
+
+        # Walk the neighbourhood once for ladders, solids and platforms,
+        # nearest row first in the direction of travel
+        rows = range(tile_y0, last_row + 1)
+        if self.vel_y < 0:
+            rows = reversed(rows)
+
+        prop_grid = level.prop_grid
+        level_width = level.width
+        level_height = level.height
+        first_col = max(tile_x0, 0)
+        last_col = min(tile_x1, level_width - 1)
+        solid_row = None
+        platform_row = None
+        for tile_y in rows:
+            if not 0 <= tile_y < level_height:
+                continue
+            row_start = tile_y * level_width
+            in_player_rect = tile_y <= tile_y1
+
+            # Check if we crossed the platform top between frames or are standing on it
+            # Use tolerance to handle floating point precision issues
+            platform_reachable = False
+            if check_platforms and platform_row is None:
+                tile_top = tile_y * TILE_SIZE
+                platform_reachable = (
+                    previous_bottom <= tile_top + platform_tolerance
+                    and player_bottom >= tile_top - platform_tolerance
                 )
-
-                # Check if we crossed the platform top between frames or are standing on it
-                # Use tolerance to handle floating point precision issues
-                player_approaching_from_above = previous_bottom <= tile_rect.top + platform_tolerance
-                player_at_or_below_platform = player_rect.bottom >= tile_rect.top - platform_tolerance
-
-                if horizontal_overlap and player_approaching_from_above and player_at_or_below_platform:
-                    self.y = tile_rect.top - self.height
-                    self.vel_y = 0
-                    self.on_ground = True
-                    self.climbing = False
-                    self.fall_through_platform = False  # Clear flag when landing
+            if not in_player_rect and not platform_reachable:
+                continue  # Rows below the player only matter as reachable platforms
+
+            for index in range(row_start + first_col, row_start + last_col + 1):
+                mask = prop_grid[index]
+                if not mask:
+                    continue
+                if in_player_rect:
+                    if mask & LADDER_BIT:
+                        self.on_ladder = True
+                    if solid_row is None and mask & SOLID_BIT:
+                        solid_row = tile_y
+                if platform_reachable and mask & PLATFORM_BIT:
+                    platform_row = tile_y
+
+        if solid_row is not None:
+            if self.vel_y > 0:  # Falling down
+                self.y = solid_row * TILE_SIZE - self.height
+                self.vel_y = 0
+                self.on_ground = True
+                self.climbing = False
+                self.fall_through_platform = False  # Clear flag when landing on solid ground
+            elif self.vel_y < 0:  # Moving up
+                self.y = (solid_row + 1) * TILE_SIZE
+                self.vel_y = 0
+        elif platform_row is not None:
+            self.y = platform_row * TILE_SIZE - self.height
+            self.vel_y = 0
+            self.on_ground = True
+            self.climbing = False
+            self.fall_through_platform = False  # Clear flag when landing
     
     def check_hazards(self, level):
         """Check if player is touching hazards"""
-        player_rect = self.get_rect()
-
-        for (tile_x, tile_y), tile in level.get_hazard_tiles():
-            tile_rect = pygame.Rect(tile_x * TILE_SIZE, tile_y * TILE_SIZE, TILE_SIZE, TILE_SIZE)
-
-            if player_rect.colliderect(tile_rect):
-                self.health -= 1  # Damage over time
-                if self.health <= 0:
-                    self.health = 0
+        tile_x0, tile_y0, tile_x1, tile_y1 = self.get_tile_span()
+        prop_grid = level.prop_grid
+        level_width = level.width
+        first_col = max(tile_x0, 0)
+        last_col = min(tile_x1, level_width - 1)
+
+        for tile_y in range(max(tile_y0, 0), min(tile_y1, level.height - 1) + 1):
+            row_start = tile_y * level_width
+            for index in range(row_start + first_col, row_start + last_col + 1):
+                if prop_grid[index] & HAZARD_BIT:
+                    # Damage over time, once per frame however many hazard tiles are touched
+                    self.health = max(0, self.health - 1)
+                    return
 
     def handle_level_boundaries(self, level):
         """Prevent player from moving past level boundaries (except bottom - allow falling to death)"""
-        # Clamp horizontal position
-        max_x = level.width * TILE_SIZE - self.width
-        self.x = max(0, min(self.x, max_x))
+        # Clamp horizontal position, stopping at (or on) either side boundary
+        max_x = level.pixel_width - self.width
+        if self.x >= max_x:
+            self.x = max_x
+            self.vel_x = 0
+        if self.x <= 0:
+            self.x = 0
+            self.vel_x = 0
 
         # Only clamp top boundary (allow falling off bottom for death)
         if self.y < 0:
             self.y = 0
             self.vel_y = 0
-
-        # Stop velocity if hitting side boundaries
-        if self.x <= 0 or self.x >= max_x:
-            self.vel_x = 0
     
     def draw(self, screen, camera_x, camera_y):
         """Draw the player"""
@@ -509,26 +698,31 @@ class Player:
         draw_y = int(self.y - camera_y)
 
         state = "attack" if self.attacking else ("run" if abs(self.vel_x) > 0.1 else "idle")
-        frames = self.sprite_frames[state]
+        frames = (self.sprite_frames if self.facing_right else self.sprite_frames_left)[state]
         frame_index = min(self.animation_frame, len(frames) - 1)
-        sprite = frames[frame_index]
-        if not self.facing_right:
-            sprite = pygame.transform.flip(sprite, True, False)
-        screen.blit(sprite, (draw_x, draw_y))
+        screen.blit(frames[frame_index], (draw_x, draw_y))
 
         # Draw sword swing if attacking
         if self.attacking:
             slash_frame = min(self.animation_frame, len(self.slash_frames) - 1)
-            slash_surface = self.slash_frames[slash_frame]
             offset_x, offset_y = self.slash_offsets[slash_frame]
-            slash_x = draw_x + offset_x
-            if not self.facing_right:
-                slash_surface = pygame.transform.flip(slash_surface, True, False)
+            if self.facing_right:
+                slash_surface = self.slash_frames[slash_frame]
+                slash_x = draw_x + offset_x
+            else:
+                slash_surface = self.slash_frames_left[slash_frame]
                 slash_x = draw_x + self.width - offset_x - slash_surface.get_width()
             slash_y = draw_y + offset_y
             screen.blit(slash_surface, (slash_x, slash_y))
 
 class Enemy:
+    __slots__ = (
+        'x', 'y', 'width', 'height', 'vel_x', 'vel_y', '_rect',
+        'enemy_type', 'health', 'alive', 'awake', 'wake_range',
+        'direction', 'start_x', 'patrol_range',
+        'shoot_cooldown', 'shoot_timer', 'shoot_range', 'shoot_range_sq', 'detection_range_sq',
+    )
+
     def __init__(self, x: int, y: int, enemy_type: EnemyType, patrol_range: int = 100):
         self.x = float(x)
         self.y = float(y)
@@ -547,57 +741,62 @@ class Enemy:
         self.shoot_cooldown = enemy_type.fire_rate
         self.shoot_timer = 0
         self.shoot_range = enemy_type.shoot_range
+        self.shoot_range_sq = self.shoot_range * self.shoot_range
+        self.detection_range_sq = enemy_type.detection_range * enemy_type.detection_range
+        # Enemies sleep until the player first comes near, then stay awake for good
+        self.awake = False
+        self.wake_range = max(enemy_type.shoot_range, enemy_type.detection_range)
+        self._rect = pygame.Rect(0, 0, self.width, self.height)  # Reused by get_rect
 
     def get_rect(self) -> pygame.Rect:
-        return pygame.Rect(int(self.x), int(self.y), self.width, self.height)
+        """Get the enemy's hitbox (the same Rect is updated in place on every call)"""
+        self._rect.x = int(self.x)
+        self._rect.y = int(self.y)
+        return self._rect
 
     def update(self, player, level):
-        """Update enemy AI and physics - returns list of new projectiles spawned"""
-        new_projectiles = []
-
+        """Update enemy AI and physics - projectiles it fires are added to level.projectiles"""
         if not self.alive:
-            return new_projectiles
+            return
 
         # Update shoot timer
         if self.shoot_timer > 0:
             self.shoot_timer -= 1
 
+        # Hoist the type lookups used by every branch below
+        enemy_type = self.enemy_type
+        ai_code = enemy_type.ai_code
+
         # AI behavior based on type
-        if self.enemy_type.ai_type == EnemyAI.STATIONARY.value:
+        if ai_code == AI_STATIONARY:
             # Don't move
             pass
 
-        elif self.enemy_type.ai_type == EnemyAI.SHOOTER.value:
+        elif ai_code == AI_SHOOTER:
             # Stationary enemy that shoots at player when in range
-            # Calculate distance to player
+            # Compare squared distances so no square root is needed
             dx = player.x - self.x
             dy = player.y - self.y
-            distance = (dx**2 + dy**2) ** 0.5
 
             # Shoot if player is in range and cooldown is ready
-            if distance <= self.shoot_range and self.shoot_timer <= 0:
+            if self.shoot_timer <= 0 and dx * dx + dy * dy <= self.shoot_range_sq:
                 # Create a projectile aimed at the player
-                projectile_x = self.x + self.width / 2
-                projectile_y = self.y + self.height / 2
-                target_x = player.x + player.width / 2
-                target_y = player.y + player.height / 2
-
                 projectile = Projectile(
-                    x=projectile_x,
-                    y=projectile_y,
-                    target_x=target_x,
-                    target_y=target_y,
-                    speed=self.enemy_type.projectile_speed,
-                    damage=self.enemy_type.projectile_damage
+                    x=self.x + self.width / 2,
+                    y=self.y + self.height / 2,
+                    target_x=player.cx,
+                    target_y=player.cy,
+                    speed=enemy_type.projectile_speed,
+                    damage=enemy_type.projectile_damage
                 )
-                new_projectiles.append(projectile)
+                level.projectiles.append(projectile)
 
                 # Reset shoot timer
                 self.shoot_timer = self.shoot_cooldown
 
-        elif self.enemy_type.ai_type == EnemyAI.PATROL.value:
+        elif ai_code == AI_PATROL:
             # Move back and forth within patrol range
-            self.vel_x = self.enemy_type.speed * self.direction
+            self.vel_x = enemy_type.speed * self.direction
 
             # Check if reached patrol boundary
             if self.x >= self.start_x + self.patrol_range:
@@ -616,41 +815,35 @@ class Enemy:
             self.y += self.vel_y
 
             # Simple ground collision (enemies don't need full collision like player)
-            for (tile_x, tile_y), tile in level.get_solid_tiles():
-                tile_rect = pygame.Rect(tile_x * TILE_SIZE, tile_y * TILE_SIZE, TILE_SIZE, TILE_SIZE)
-                enemy_rect = self.get_rect()
-
-                if enemy_rect.colliderect(tile_rect):
-                    if self.vel_y > 0:  # Falling
-                        self.y = tile_rect.top - self.height
-                        self.vel_y = 0
+            # Land on the highest solid row overlapped, like the player's solid landing,
+            # so walking into a one-tile step lifts the enemy on top of it
+            if self.vel_y > 0:  # Falling
+                landing_row = level.top_solid_row(self.get_rect())
+                if landing_row is not None:
+                    self.y = landing_row * TILE_SIZE - self.height
+                    self.vel_y = 0
 
-        elif self.enemy_type.ai_type == EnemyAI.CHASE.value:
+        elif ai_code == AI_CHASE:
             # Move towards player
-            dx = player.x - self.x
-            dy = player.y - self.y
-            distance = (dx**2 + dy**2) ** 0.5
+            vel_x, vel_y, distance = seek_velocity(player.x - self.x, player.y - self.y, enemy_type.speed)
 
             if distance > 0:
-                self.vel_x = (dx / distance) * self.enemy_type.speed
-                self.vel_y = (dy / distance) * self.enemy_type.speed
+                self.vel_x = vel_x
+                self.vel_y = vel_y
                 self.x += self.vel_x
                 self.y += self.vel_y
 
-        elif self.enemy_type.ai_type == EnemyAI.FLYING.value:
+        elif ai_code == AI_FLYING:
             # Flying chase - similar to chase but with vertical movement
             dx = player.x - self.x
             dy = player.y - self.y
-            distance = (dx**2 + dy**2) ** 0.5
+            distance_sq = dx * dx + dy * dy
 
-            if distance > 0 and distance < self.enemy_type.detection_range:  # Only chase if within range
-                self.vel_x = (dx / distance) * self.enemy_type.speed
-                self.vel_y = (dy / distance) * self.enemy_type.speed
+            if 0 < distance_sq < self.detection_range_sq:  # Only chase if within range
+                self.vel_x, self.vel_y, _ = seek_velocity(dx, dy, enemy_type.speed)
                 self.x += self.vel_x
                 self.y += self.vel_y
 
-        return new_projectiles
-
     def take_damage(self, amount: int):
         """Take damage and check if dead"""
         self.health -= amount
@@ -665,10 +858,7 @@ class Enemy:
         draw_x = int(self.x - camera_x)
         draw_y = int(self.y - camera_y)
 
-        if self.enemy_type.image:
-            screen.blit(self.enemy_type.image, (draw_x, draw_y))
-        else:
-            pygame.draw.rect(screen, self.enemy_type.color, (draw_x, draw_y, self.width, self.height))
+        screen.blit(self.enemy_type.image or self.enemy_type.fill_surface, (draw_x, draw_y))
 
         # Draw health bar for enemies with finite health
         if self.enemy_type.health < 999:
@@ -680,6 +870,8 @@ class Enemy:
 
 class Projectile:
     """Projectile fired by enemies (like fireballs)"""
+    __slots__ = ('x', 'y', 'width', 'height', 'vel_x', 'vel_y', 'damage', 'active', '_rect')
+
     def __init__(self, x: float, y: float, target_x: float, target_y: float, speed: float = 3.0, damage: int = 10):
         self.x = x
         self.y = y
@@ -700,8 +892,13 @@ class Projectile:
             self.vel_x = speed
             self.vel_y = 0
 
+        self._rect = pygame.Rect(0, 0, self.width, self.height)  # Reused by get_rect
+
     def get_rect(self) -> pygame.Rect:
-        return pygame.Rect(int(self.x), int(self.y), self.width, self.height)
+        """Get the projectile's hitbox (the same Rect is updated in place on every call)"""
+        self._rect.x = int(self.x)
+        self._rect.y = int(self.y)
+        return self._rect
 
     def update(self, level):
         """Update projectile position and check for collisions with tiles"""
@@ -711,16 +908,23 @@ class Projectile:
         self.x += self.vel_x
         self.y += self.vel_y
 
-        # Check collision with solid tiles
-        projectile_rect = self.get_rect()
-        for (tile_x, tile_y), tile in level.get_solid_tiles():
-            tile_rect = pygame.Rect(tile_x * TILE_SIZE, tile_y * TILE_SIZE, TILE_SIZE, TILE_SIZE)
-            if projectile_rect.colliderect(tile_rect):
-                self.active = False
-                return
+        # Check collision with solid tiles in the grid cells the projectile covers
+        left = int(self.x)
+        top = int(self.y)
+        prop_grid = level.prop_grid
+        level_width = level.width
+        first_col = max(left // TILE_SIZE, 0)
+        last_col = min((left + self.width - 1) // TILE_SIZE, level_width - 1)
+        for tile_y in range(max(top // TILE_SIZE, 0),
+                            min((top + self.height - 1) // TILE_SIZE, level.height - 1) + 1):
+            row_start = tile_y * level_width
+            for index in range(row_start + first_col, row_start + last_col + 1):
+                if prop_grid[index] & SOLID_BIT:
+                    self.active = False
+                    return
 
         # Deactivate if out of bounds
-        if self.x < 0 or self.x > level.width * TILE_SIZE or self.y < 0 or self.y > level.height * TILE_SIZE:
+        if self.x < 0 or self.x > level.pixel_width or self.y < 0 or self.y > level.pixel_height:
             self.active = False
 
     def draw(self, screen, camera_x, camera_y):
@@ -741,6 +945,8 @@ class Projectile:
         pygame.draw.circle(screen, (255, 255, 0), (center_x, center_y), self.width // 3)
 
 class Collectible:
+    __slots__ = ('x', 'y', 'width', 'height', 'collectible_type', 'collected', '_rect')
+
     def __init__(self, x: int, y: int, collectible_type: CollectibleType):
         self.x = x
         self.y = y
@@ -748,9 +954,11 @@ class Collectible:
         self.width = TILE_SIZE
         self.height = TILE_SIZE
         self.collected = False
+        # Collectibles never move, so their integer bounds are fixed
+        self._rect = pygame.Rect(int(x), int(y), self.width, self.height)
 
     def get_rect(self) -> pygame.Rect:
-        return pygame.Rect(self.x, self.y, self.width, self.height)
+        return self._rect
 
     def draw(self, screen, camera_x, camera_y):
         """Draw the collectible"""
@@ -760,29 +968,41 @@ class Collectible:
         draw_x = int(self.x - camera_x)
         draw_y = int(self.y - camera_y)
 
-        if self.collectible_type.image:
-            screen.blit(self.collectible_type.image, (draw_x, draw_y))
-        else:
-            # Draw as a circle
-            center_x = draw_x + self.width // 2
-            center_y = draw_y + self.height // 2
-            pygame.draw.circle(screen, self.collectible_type.color, (center_x, center_y), TILE_SIZE // 2)
+        # Image-less types are drawn as a pre-rendered coloured circle
+        screen.blit(self.collectible_type.image or self.collectible_type.fill_surface, (draw_x, draw_y))
 
 class Level:
     def __init__(self, filename: str):
         self.filename = filename
         self.width = 0
         self.height = 0
+        # Level size in pixels and camera limits, fixed once the level is loaded
+        self.pixel_width = 0
+        self.pixel_height = 0
+        self.max_camera_x = 0
+        self.max_camera_y = 0
         self.tile_types: Dict[int, TileType] = {}
         self.tiles: Dict[str, Dict[Tuple[int, int], Tile]] = {
             'background': {},
             'main': {},
             'foreground': {}
         }
+        # World-space bounds of every end-level tile (rebuilt whenever the tile layout changes)
+        self.end_level_rects: List[pygame.Rect] = []
+        self.player_start: Optional[Tuple[int, int]] = None
+        # Property bit flags merged across all layers, one byte per cell
+        # in row-major order (index = tile_y * width + tile_x)
+        self.prop_grid = bytearray()
+        # Pre-rendered tile pages keyed by page coordinate (None = page has no tiles)
+        self._tile_pages: Dict[Tuple[int, int], Optional[pygame.Surface]] = {}
+        self._tile_pages_show_end_level = False
         self.enemy_types: Dict[int, EnemyType] = {}
         self.enemies: List[Enemy] = []
+        self.active_enemies: List[Enemy] = []  # Enemies with an AI that does something each frame
         self.collectible_types: Dict[int, CollectibleType] = {}
         self.collectibles: List[Collectible] = []
+        # Collectibles bucketed by the cell holding their top-left corner (they never move)
+        self.collectible_cells: Dict[Tuple[int, int], List[Collectible]] = {}
         self.projectiles: List[Projectile] = []
         self.score = 0
         self.keys_collected = 0
@@ -790,19 +1010,26 @@ class Level:
         self.required_collectibles_collected = 0
         self.required_enemies_total = 0
         self.required_enemies_killed = 0
+        self.requirements_met = False  # Kept in step with the counters by update_requirements_met
         # Background image (legacy - for backwards compatibility)
         self.background_image: Optional[pygame.Surface] = None
+        self.background_scaled: Optional[pygame.Surface] = None  # background_image at its drawn size
         self.background_x = 0
         self.background_y = 0
         self.background_width = 0
         self.background_height = 0
         # Background layers (new parallax system)
         self.background_layers: List[BackgroundImage] = []
+        self.back_layers: List[BackgroundImage] = []  # Drawn behind tiles, far to near
+        self.front_layers: List[BackgroundImage] = []  # Drawn in front of tiles and sprites
         # Viewport settings (camera starting position and zoom)
         self.viewport_x = 0
         self.viewport_y = 0
         self.viewport_width = SCREEN_WIDTH
         self.viewport_height = SCREEN_HEIGHT
+        # Player distance on each axis within which an enemy wakes (set from the viewport in load_level)
+        self.enemy_wake_x = SCREEN_WIDTH + 2 * TILE_SIZE
+        self.enemy_wake_y = SCREEN_HEIGHT + 2 * TILE_SIZE
         self.load_level(filename)
     
     def load_level(self, filename: str):
@@ -812,6 +1039,8 @@ class Level:
 
         self.width = data['width']
         self.height = data['height']
+        self.pixel_width = self.width * TILE_SIZE
+        self.pixel_height = self.height * TILE_SIZE
 
         # Load tile types
         for tid_str, ttype_data in data['tile_types'].items():
@@ -819,8 +1048,7 @@ class Level:
             image = None
             if ttype_data['image_path'] and os.path.exists(ttype_data['image_path']):
                 try:
-                    image = pygame.image.load(ttype_data['image_path'])
-                    image = pygame.transform.scale(image, (TILE_SIZE, TILE_SIZE))
+                    image = load_tile_image(ttype_data['image_path'])
                 except:
                     pass
 
@@ -829,9 +1057,13 @@ class Level:
                 name=ttype_data['name'],
                 image_path=ttype_data['image_path'],
                 image=image,
-                properties=ttype_data['properties'],
+                properties=frozenset(ttype_data['properties']),
                 color=tuple(ttype_data['color'])
             )
+            if image is None:
+                fill_surface = pygame.Surface((TILE_SIZE, TILE_SIZE))
+                fill_surface.fill(self.tile_types[tid].color)
+                self.tile_types[tid].fill_surface = convert_surface(fill_surface)
 
         # Load tiles
         for layer, tiles_data in data['layers'].items():
@@ -839,8 +1071,10 @@ class Level:
                 x, y = map(int, pos_str.split(','))
                 self.tiles[layer][(x, y)] = Tile(
                     tile_type_id=tile_data['tile_type_id'],
-                    layer=tile_data['layer']
+                    layer=tile_data['layer'],
+                    tile_type=self.tile_types.get(tile_data['tile_type_id'])
                 )
+        self._rebuild_property_caches()
 
         # Load enemy types
         if 'enemy_types' in data:
@@ -849,8 +1083,7 @@ class Level:
                 image = None
                 if etype_data['image_path'] and os.path.exists(etype_data['image_path']):
                     try:
-                        image = pygame.image.load(etype_data['image_path'])
-                        image = pygame.transform.scale(image, (TILE_SIZE, TILE_SIZE))
+                        image = load_tile_image(etype_data['image_path'])
                     except:
                         pass
 
@@ -871,6 +1104,10 @@ class Level:
                     fire_rate=etype_data.get('fire_rate', 120),
                     projectile_damage=etype_data.get('projectile_damage', 1)
                 )
+                if image is None:
+                    fill_surface = pygame.Surface((TILE_SIZE, TILE_SIZE))
+                    fill_surface.fill(self.enemy_types[eid].color)
+                    self.enemy_types[eid].fill_surface = convert_surface(fill_surface)
 
         # Load enemies
         if 'enemies' in data:
@@ -884,6 +1121,8 @@ class Level:
                         patrol_range=enemy_data.get('patrol_range', 100)
                     )
                     self.enemies.append(enemy)
+                    if enemy_type.ai_code != AI_STATIONARY:
+                        self.active_enemies.append(enemy)
                     # Count required enemies
                     if enemy_type.required:
                         self.required_enemies_total += 1
@@ -895,8 +1134,7 @@ class Level:
                 image = None
                 if ctype_data['image_path'] and os.path.exists(ctype_data['image_path']):
                     try:
-                        image = pygame.image.load(ctype_data['image_path'])
-                        image = pygame.transform.scale(image, (TILE_SIZE, TILE_SIZE))
+                        image = load_tile_image(ctype_data['image_path'])
                     except:
                         pass
 
@@ -910,6 +1148,11 @@ class Level:
                     color=tuple(ctype_data['color']),
                     required=ctype_data.get('required', False)
                 )
+                if image is None:
+                    fill_surface = pygame.Surface((TILE_SIZE, TILE_SIZE), pygame.SRCALPHA)
+                    pygame.draw.circle(fill_surface, self.collectible_types[cid].color,
+                                       (TILE_SIZE // 2, TILE_SIZE // 2), TILE_SIZE // 2)
+                    self.collectible_types[cid].fill_surface = convert_surface(fill_surface)
 
         # Load collectibles
         if 'collectibles' in data:
@@ -922,10 +1165,14 @@ class Level:
                         collectible_type=collectible_type
                     )
                     self.collectibles.append(collectible)
+                    cell = (collectible.x // COLLECTIBLE_CELL_SIZE, collectible.y // COLLECTIBLE_CELL_SIZE)
+                    self.collectible_cells.setdefault(cell, []).append(collectible)
                     # Count required collectibles
                     if collectible_type.required:
                         self.required_collectibles_total += 1
 
+        self.update_requirements_met()  # Levels with no requirements start open
+
         # Load background image (legacy - for backwards compatibility)
         if 'background' in data and data['background']:
             bg_data = data['background']
@@ -938,6 +1185,9 @@ class Level:
             if image_path and os.path.exists(image_path):
                 try:
                     self.background_image = pygame.image.load(image_path)
+                    if self.background_width > 0 and self.background_height > 0:
+                        self.background_scaled = convert_surface(pygame.transform.scale(
+                            self.background_image, (self.background_width, self.background_height)))
                 except Exception as e:
                     print(f"Error loading background image: {e}")
                     self.background_image = None
@@ -966,10 +1216,20 @@ class Level:
                         parallax_factor=bg_data.get('parallax_factor', default_parallax),
                         is_foreground=bg_data.get('is_foreground', False)
                     )
+                    if image:
+                        # Layers never change size, so scale once instead of every frame
+                        bg_img.scaled_image = convert_surface(
+                            pygame.transform.scale(image, (bg_img.width, bg_img.height)))
                     self.background_layers.append(bg_img)
                 except Exception as e:
                     print(f"Error loading background layer: {e}")
 
+        # Split and order the layers once; they never change after loading
+        # (the sort is stable, so equal layer indices keep their file order)
+        self.background_layers.sort(key=lambda bg: bg.layer_index)
+        self.back_layers = [bg for bg in self.background_layers if not bg.is_foreground]
+        self.front_layers = [bg for bg in self.background_layers if bg.is_foreground]
+
         # Load viewport settings
         if 'viewport' in data:
             vp_data = data['viewport']
@@ -978,54 +1238,83 @@ class Level:
             self.viewport_width = vp_data.get('width', SCREEN_WIDTH)
             self.viewport_height = vp_data.get('height', SCREEN_HEIGHT)
 
-    def get_solid_tiles(self):
-        """Get all tiles with solid property"""
-        solid_tiles = []
-        for layer in ['background', 'main', 'foreground']:
-            for (tile_x, tile_y), tile in self.tiles[layer].items():
-                tile_type = self.tile_types.get(tile.tile_type_id)
-                if tile_type and TileProperty.SOLID.value in tile_type.properties:
-                    solid_tiles.append(((tile_x, tile_y), tile))
-        return solid_tiles
-    
-    def get_platform_tiles(self):
-        """Get all tiles with platform property"""
-        platform_tiles = []
-        for layer in ['background', 'main', 'foreground']:
-            for (tile_x, tile_y), tile in self.tiles[layer].items():
-                tile_type = self.tile_types.get(tile.tile_type_id)
-                if tile_type and TileProperty.PLATFORM.value in tile_type.properties:
-                    platform_tiles.append(((tile_x, tile_y), tile))
-        return platform_tiles
-    
-    def get_hazard_tiles(self):
-        """Get all tiles with hazard property"""
-        hazard_tiles = []
-        for layer in ['background', 'main', 'foreground']:
-            for (tile_x, tile_y), tile in self.tiles[layer].items():
-                tile_type = self.tile_types.get(tile.tile_type_id)
-                if tile_type and TileProperty.HAZARD.value in tile_type.properties:
-                    hazard_tiles.append(((tile_x, tile_y), tile))
-        return hazard_tiles
-
-    def get_end_level_tiles(self):
-        """Get all tiles with end_level property"""
-        end_level_tiles = []
+        # Clamp limits for a camera showing viewport_width x viewport_height
+        self.max_camera_x = max(0, self.pixel_width - self.viewport_width)
+        self.max_camera_y = max(0, self.pixel_height - self.viewport_height)
+
+        # An enemy this close to the player on both axes may be on screen, so it wakes up
+        self.enemy_wake_x = self.viewport_width + 2 * TILE_SIZE
+        self.enemy_wake_y = self.viewport_height + 2 * TILE_SIZE
+
+    def _rebuild_property_caches(self):
+        """Rebuild the property grid, end-level rects and player start from the tile layers"""
+        self.end_level_rects = []
+        self.prop_grid = bytearray(self.width * self.height)
+        player_starts = {}  # First player start tile found in each layer
         for layer in ['background', 'main', 'foreground']:
-            for (tile_x, tile_y), tile in self.tiles[layer].items():
-                tile_type = self.tile_types.get(tile.tile_type_id)
-                if tile_type and TileProperty.END_LEVEL.value in tile_type.properties:
-                    end_level_tiles.append(((tile_x, tile_y), tile))
-        return end_level_tiles
+            for pos, tile in self.tiles[layer].items():
+                tile_type = tile.tile_type
+                if not tile_type:
+                    continue
+                mask = tile_type.prop_mask
+                tile_x, tile_y = pos
+                if 0 <= tile_x < self.width and 0 <= tile_y < self.height:
+                    self.prop_grid[tile_y * self.width + tile_x] |= mask
+                if mask & END_LEVEL_BIT:
+                    self.end_level_rects.append(
+                        pygame.Rect(tile_x * TILE_SIZE, tile_y * TILE_SIZE, TILE_SIZE, TILE_SIZE))
+                if mask & PLAYER_START_BIT and layer not in player_starts:
+                    player_starts[layer] = pos
+
+        # The main layer's start wins, then foreground, then background
+        self.player_start = None
+        for layer in ['main', 'foreground', 'background']:
+            if layer in player_starts:
+                self.player_start = player_starts[layer]
+                break
+
+    def top_solid_row(self, rect: pygame.Rect) -> Optional[int]:
+        """Return the topmost tile row with a solid tile overlapping rect, or None"""
+        prop_grid = self.prop_grid
+        first_col = max(rect.left // TILE_SIZE, 0)
+        last_col = min((rect.right - 1) // TILE_SIZE, self.width - 1)
+        # Scan down from the top of rect and stop at the first hit
+        for tile_y in range(max(rect.top // TILE_SIZE, 0), min((rect.bottom - 1) // TILE_SIZE, self.height - 1) + 1):
+            row_start = tile_y * self.width
+            for index in range(row_start + first_col, row_start + last_col + 1):
+                if prop_grid[index] & SOLID_BIT:
+                    return tile_y
+        return None
 
     def get_player_start(self) -> Optional[Tuple[int, int]]:
         """Find the first player start tile position in tile coordinates."""
-        for layer in ['main', 'foreground', 'background']:
-            for (tile_x, tile_y), tile in self.tiles[layer].items():
-                tile_type = self.tile_types.get(tile.tile_type_id)
-                if tile_type and TileProperty.PLAYER_START.value in tile_type.properties:
-                    return tile_x, tile_y
-        return None
+        return self.player_start
+
+    def update_enemies(self, player):
+        """Update every living enemy for one frame (fired projectiles land in self.projectiles)"""
+        # Stationary enemies never change, so only the active ones are visited
+        for enemy in self.active_enemies:
+            if not enemy.alive:
+                continue
+            if not enemy.awake:
+                # Far-off enemies the player hasn't reached yet don't need simulating
+                if (abs(enemy.x - player.x) > max(self.enemy_wake_x, enemy.wake_range)
+                        or abs(enemy.y - player.y) > max(self.enemy_wake_y, enemy.wake_range)):
+                    continue
+                enemy.awake = True
+            enemy.update(player, self)
+
+    def collectibles_near(self, rect: pygame.Rect):
+        """Yield the collectibles whose cell could overlap rect"""
+        # A collectible overlaps rect only if its left/top edge lies within a width/height of it
+        first_x = (rect.left - TILE_SIZE + 1) // COLLECTIBLE_CELL_SIZE
+        last_x = (rect.right - 1) // COLLECTIBLE_CELL_SIZE
+        first_y = (rect.top - TILE_SIZE + 1) // COLLECTIBLE_CELL_SIZE
+        last_y = (rect.bottom - 1) // COLLECTIBLE_CELL_SIZE
+        cells = self.collectible_cells
+        for cell_y in range(first_y, last_y + 1):
+            for cell_x in range(first_x, last_x + 1):
+                yield from cells.get((cell_x, cell_y), ())
 
     def all_required_collectibles_collected(self):
         """Check if all required collectibles have been collected"""
@@ -1033,119 +1322,166 @@ class Level:
 
     def all_requirements_met(self):
         """Check if all level completion requirements are met (collectibles AND enemies)"""
+        return self.requirements_met
+
+    def update_requirements_met(self):
+        """Recompute requirements_met; call after changing a required collectible or enemy count"""
         collectibles_done = self.required_collectibles_collected >= self.required_collectibles_total
         enemies_done = self.required_enemies_killed >= self.required_enemies_total
-        return collectibles_done and enemies_done
+        self.requirements_met = collectibles_done and enemies_done
 
-    def get_ladder_tiles(self):
-        """Get all tiles with ladder property"""
-        ladder_tiles = []
-        for layer in ['background', 'main', 'foreground']:
-            for (tile_x, tile_y), tile in self.tiles[layer].items():
-                tile_type = self.tile_types.get(tile.tile_type_id)
-                if tile_type and TileProperty.LADDER.value in tile_type.properties:
-                    ladder_tiles.append(((tile_x, tile_y), tile_type))
-        return ladder_tiles
-    
     def _draw_background_layer(self, screen, bg_img, camera_x, camera_y):
         """Helper method to draw a single background layer"""
-        if not bg_img.image:
+        if not bg_img.image or bg_img.width <= 0 or bg_img.height <= 0:
             return
 
         # Apply parallax effect: further layers scroll slower
         parallax_x = bg_img.x - (camera_x * bg_img.parallax_factor)
         parallax_y = bg_img.y - (camera_y * bg_img.parallax_factor)
 
-        # Scale and draw the background
-        scaled_bg = pygame.transform.scale(bg_img.image, (bg_img.width, bg_img.height))
         if bg_img.repeat_x or bg_img.repeat_y:
-            tile_width = bg_img.width
-            tile_height = bg_img.height
+            # The repeats are pre-tiled into one surface, so a single blit shifted
+            # back by the scroll within one tile covers the screen
+            tiled = self._get_tiled_surface(bg_img, screen.get_width(), screen.get_height())
             start_x = parallax_x
             start_y = parallax_y
-
-            if bg_img.repeat_x and tile_width > 0:
-                start_x = (parallax_x % tile_width) - tile_width
-            if bg_img.repeat_y and tile_height > 0:
-                start_y = (parallax_y % tile_height) - tile_height
-
-            if bg_img.repeat_x and bg_img.repeat_y:
-                tile_x = start_x
-                while tile_x < SCREEN_WIDTH:
-                    tile_y = start_y
-                    while tile_y < SCREEN_HEIGHT:
-                        screen.blit(scaled_bg, (tile_x, tile_y))
-                        tile_y += tile_height
-                    tile_x += tile_width
-            elif bg_img.repeat_x:
-                tile_x = start_x
-                while tile_x < SCREEN_WIDTH:
-                    screen.blit(scaled_bg, (tile_x, parallax_y))
-                    tile_x += tile_width
-            elif bg_img.repeat_y:
-                tile_y = start_y
-                while tile_y < SCREEN_HEIGHT:
-                    screen.blit(scaled_bg, (parallax_x, tile_y))
-                    tile_y += tile_height
+            if bg_img.repeat_x:
+                start_x = math.floor(parallax_x % bg_img.width) - bg_img.width
+            if bg_img.repeat_y:
+                start_y = math.floor(parallax_y % bg_img.height) - bg_img.height
+            screen.blit(tiled, (start_x, start_y))
         else:
-            screen.blit(scaled_bg, (parallax_x, parallax_y))
+            screen.blit(bg_img.scaled_image, (parallax_x, parallax_y))
+
+    def _get_tiled_surface(self, bg_img, view_width: int, view_height: int) -> pygame.Surface:
+        """Get bg_img's repeats laid out to cover a view of the given size from any scroll offset"""
+        columns = view_width // bg_img.width + 2 if bg_img.repeat_x else 1
+        rows = view_height // bg_img.height + 2 if bg_img.repeat_y else 1
+        size = (columns * bg_img.width, rows * bg_img.height)
+        tiled = bg_img.tiled_surface
+        if tiled is None or tiled.get_size() != size:
+            image = bg_img.scaled_image
+            has_alpha = image.get_flags() & pygame.SRCALPHA
+            tiled = pygame.Surface(size, pygame.SRCALPHA if has_alpha else 0)
+            # Copy the pixels (alpha included) rather than blending onto the empty surface
+            flags = pygame.BLEND_RGBA_MAX if has_alpha else 0
+            tiled.blits([(image, (column * bg_img.width, row * bg_img.height), None, flags)
+                         for column in range(columns) for row in range(rows)], doreturn=False)
+            tiled = bg_img.tiled_surface = convert_surface(tiled)
+        return tiled
+
+    def _invalidate_tile_pages(self):
+        """Drop the pre-rendered tile pages so they are redrawn from the tile layers"""
+        self._tile_pages = {}
+
+    def _render_tile_page(self, page_x: int, page_y: int) -> Optional[pygame.Surface]:
+        """Render every layer's tiles within one page onto a transparent surface"""
+        tiles_per_page = TILE_PAGE_SIZE // TILE_SIZE
+        first_x = page_x * tiles_per_page
+        first_y = page_y * tiles_per_page
+        # Only the part of the page that lies inside the level can hold tiles
+        columns = range(max(first_x, 0), min(first_x + tiles_per_page, self.width))
+        rows = range(max(first_y, 0), min(first_y + tiles_per_page, self.height))
+        blits = []
+
+        for layer in ['background', 'main', 'foreground']:
+            layer_tiles = self.tiles[layer]
+            if not layer_tiles:
+                continue
+            for tile_y in rows:
+                for tile_x in columns:
+                    tile = layer_tiles.get((tile_x, tile_y))
+                    if not tile or not tile.tile_type:
+                        continue
+                    tile_type = tile.tile_type
+                    if tile_type.prop_mask & PLAYER_START_BIT:
+                        continue
+                    # Only show END_LEVEL tiles when all requirements are met
+                    if tile_type.prop_mask & END_LEVEL_BIT and not self._tile_pages_show_end_level:
+                        continue
+
+                    local_x = (tile_x - first_x) * TILE_SIZE
+                    local_y = (tile_y - first_y) * TILE_SIZE
+                    blits.append((tile_type.image or tile_type.fill_surface, (local_x, local_y)))
+
+        if not blits:
+            return None
+        # One C call for the whole page, in layer order
+        page = pygame.Surface((TILE_PAGE_SIZE, TILE_PAGE_SIZE), pygame.SRCALPHA)
+        page.blits(blits, doreturn=False)
+        return convert_surface(page)
+
+    def _draw_tiles(self, screen, camera_x, camera_y):
+        """Blit the pre-rendered tile pages that overlap the view"""
+        # END_LEVEL tiles appear once requirements are met, so re-render pages then
+        show_end_level = self.all_requirements_met()
+        if show_end_level != self._tile_pages_show_end_level:
+            self._tile_pages_show_end_level = show_end_level
+            self._invalidate_tile_pages()
+
+        # Round the camera up so tiles line up with sprites drawn at int(x - camera_x)
+        view_x = math.ceil(camera_x)
+        view_y = math.ceil(camera_y)
+
+        # Visible page range, clipped to the pages the level actually covers
+        first_page_x = max(0, view_x // TILE_PAGE_SIZE)
+        first_page_y = max(0, view_y // TILE_PAGE_SIZE)
+        last_page_x = min((view_x + screen.get_width() - 1) // TILE_PAGE_SIZE,
+                          (self.pixel_width - 1) // TILE_PAGE_SIZE)
+        last_page_y = min((view_y + screen.get_height() - 1) // TILE_PAGE_SIZE,
+                          (self.pixel_height - 1) // TILE_PAGE_SIZE)
+
+        blits = []
+        for page_y in range(first_page_y, last_page_y + 1):
+            for page_x in range(first_page_x, last_page_x + 1):
+                key = (page_x, page_y)
+                if key in self._tile_pages:
+                    page = self._tile_pages[key]
+                else:
+                    page = self._tile_pages[key] = self._render_tile_page(page_x, page_y)
+                if page:
+                    blits.append((page, (page_x * TILE_PAGE_SIZE - view_x, page_y * TILE_PAGE_SIZE - view_y)))
+        screen.blits(blits, doreturn=False)
 
     def draw(self, screen, camera_x, camera_y):
         """Draw the level"""
-        # Separate background and foreground layers
-        background_layers = [bg for bg in self.background_layers if not bg.is_foreground]
-        foreground_layers = [bg for bg in self.background_layers if bg.is_foreground]
-
         # Draw background layers (sorted from far to near by layer_index)
-        sorted_backgrounds = sorted(background_layers, key=lambda bg: bg.layer_index)
-        for bg_img in sorted_backgrounds:
+        for bg_img in self.back_layers:
             self._draw_background_layer(screen, bg_img, camera_x, camera_y)
 
         # Draw legacy background image if loaded (for backwards compatibility)
-        if self.background_image and self.background_width > 0 and self.background_height > 0:
+        if self.background_scaled:
             screen_x = self.background_x - camera_x
             screen_y = self.background_y - camera_y
-            scaled_bg = pygame.transform.scale(self.background_image, (self.background_width, self.background_height))
-            screen.blit(scaled_bg, (screen_x, screen_y))
+            screen.blit(self.background_scaled, (screen_x, screen_y))
 
         # Draw tiles
-        for layer in ['background', 'main', 'foreground']:
-            for (tile_x, tile_y), tile in self.tiles[layer].items():
-                screen_x = tile_x * TILE_SIZE - camera_x
-                screen_y = tile_y * TILE_SIZE - camera_y
-
-                # Only draw if visible
-                if -TILE_SIZE < screen_x < SCREEN_WIDTH and -TILE_SIZE < screen_y < SCREEN_HEIGHT:
-                    tile_type = self.tile_types.get(tile.tile_type_id)
-                    if tile_type:
-                        if TileProperty.PLAYER_START.value in tile_type.properties:
-                            continue
-                        # Only show END_LEVEL tiles when all requirements are met
-                        if TileProperty.END_LEVEL.value in tile_type.properties:
-                            if not self.all_requirements_met():
-                                continue  # Skip drawing END_LEVEL tile
-
-                        if tile_type.image:
-                            screen.blit(tile_type.image, (screen_x, screen_y))
-                        else:
-                            pygame.draw.rect(screen, tile_type.color,
-                                           (screen_x, screen_y, TILE_SIZE, TILE_SIZE))
+        self._draw_tiles(screen, camera_x, camera_y)
+
+        # Sprites are at most TILE_SIZE across and the enemy health bar sits 5px above,
+        # so one tile of margin keeps anything that can reach the screen
+        left = camera_x - TILE_SIZE
+        right = camera_x + screen.get_width() + TILE_SIZE
+        top = camera_y - TILE_SIZE
+        bottom = camera_y + screen.get_height() + TILE_SIZE
 
         # Draw collectibles
         for collectible in self.collectibles:
-            collectible.draw(screen, camera_x, camera_y)
+            if left < collectible.x < right and top < collectible.y < bottom:
+                collectible.draw(screen, camera_x, camera_y)
 
         # Draw enemies
         for enemy in self.enemies:
-            enemy.draw(screen, camera_x, camera_y)
+            if left < enemy.x < right and top < enemy.y < bottom:
+                enemy.draw(screen, camera_x, camera_y)
 
         # Draw projectiles
         for projectile in self.projectiles:
-            projectile.draw(screen, camera_x, camera_y)
+            if left < projectile.x < right and top < projectile.y < bottom:
+                projectile.draw(screen, camera_x, camera_y)
 
         # Draw foreground layers (sorted by layer_index for consistent ordering)
-        sorted_foregrounds = sorted(foreground_layers, key=lambda bg: bg.layer_index)
-        for bg_img in sorted_foregrounds:
+        for bg_img in self.front_layers:
             self._draw_background_layer(screen, bg_img, camera_x, camera_y)
 
 class HighScoreManager:
@@ -1162,6 +1498,9 @@ class HighScoreManager:
                 with open(self.filename, 'r') as f:
                     data = json.load(f)
                     self.scores = [(entry['name'], entry['score']) for entry in data]
+                    # add_score relies on the list being the top 10, best first
+                    self.scores.sort(key=lambda x: x[1], reverse=True)
+                    del self.scores[10:]
         except Exception as e:
             print(f"Error loading high scores: {e}")
             self.scores = []
@@ -1177,9 +1516,11 @@ class HighScoreManager:
 
     def add_score(self, name: str, score: int):
         """Add a new score and keep top 10"""
-        self.scores.append((name, score))
-        self.scores.sort(key=lambda x: x[1], reverse=True)
-        self.scores = self.scores[:10]  # Keep top 10
+        if not self.is_high_score(score):
+            return  # Wouldn't make the list, so there is nothing to change or save
+        # The list is kept sorted high to low, so insert after any equal scores
+        bisect.insort(self.scores, (name, score), key=lambda entry: -entry[1])
+        del self.scores[10:]  # Keep top 10
         self.save_scores()
 
     def is_high_score(self, score: int) -> bool:
@@ -1192,6 +1533,29 @@ class HighScoreManager:
         """Get all high scores"""
         return self.scores
 
+# Rendered menu text keyed by (font, text, colour), since the menus redraw the same strings every frame
+_menu_text_cache: Dict[Tuple[pygame.font.Font, str, Tuple[int, int, int]], pygame.Surface] = {}
+
+def render_menu_text(font: pygame.font.Font, text: str, color: Tuple[int, int, int]) -> pygame.Surface:
+    """Render antialiased text, reusing the surface if this font, text and colour were drawn before"""
+    key = (font, text, color)
+    surface = _menu_text_cache.get(key)
+    if surface is None:
+        surface = _menu_text_cache[key] = convert_surface(font.render(text, True, color))
+    return surface
+
+def render_menu_background(bg_color) -> pygame.Surface:
+    """Render the static checkered backdrop shared by the menu screens"""
+    background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+    background.fill(bg_color)
+
+    # Draw decorative elements (retro style)
+    for i in range(0, SCREEN_WIDTH, 40):
+        for j in range(0, SCREEN_HEIGHT, 40):
+            if (i + j) % 80 == 0:
+                pygame.draw.rect(background, (30, 20, 40), (i, j, 20, 20))
+    return convert_surface(background)
+
 class TitleScreen:
     """Retro-style title screen with menu"""
     def __init__(self, screen, font, large_font):
@@ -1209,9 +1573,13 @@ class TitleScreen:
         self.menu_color = (200, 200, 200)   # Light gray
         self.selected_color = (255, 255, 100)  # Yellow
         self.bg_color = (20, 10, 30)  # Dark purple
+        self.background = render_menu_background(self.bg_color)
 
         # Animation
         self.pulse_timer = 0
+        # The title pulse repeats every 60 frames, so tabulate its brightness once
+        self.pulse_offsets = [int(5 * abs((frame / 60.0) * 2 - 1)) for frame in range(60)]
+        self.pulsed_titles: Dict[int, pygame.Surface] = {}  # Rendered title keyed by pulse offset
 
         # Load title image if available
         self.title_image = None
@@ -1239,16 +1607,16 @@ class TitleScreen:
         """Update animations"""
         self.pulse_timer += 1
 
+    def frame_key(self):
+        """Everything draw() depends on, so an unchanged key means an unchanged frame"""
+        # Only the text title pulses; the title image is static
+        pulse_offset = None if self.title_image else self.pulse_offsets[self.pulse_timer % 60]
+        return (self.selected_index, pulse_offset)
+
     def draw(self):
         """Draw the title screen"""
         # Background
-        self.screen.fill(self.bg_color)
-
-        # Draw decorative elements (retro style)
-        for i in range(0, SCREEN_WIDTH, 40):
-            for j in range(0, SCREEN_HEIGHT, 40):
-                if (i + j) % 80 == 0:
-                    pygame.draw.rect(self.screen, (30, 20, 40), (i, j, 20, 20))
+        self.screen.blit(self.background, (0, 0))
 
         # Draw title - use image if available, otherwise use text
         if self.title_image:
@@ -1260,22 +1628,25 @@ class TitleScreen:
             # Title with shadow effect
             title_text = "CASTLES"
             # Shadow
-            title_shadow = self.title_font.render(title_text, True, BLACK)
+            title_shadow = render_menu_text(self.title_font, title_text, BLACK)
             shadow_rect = title_shadow.get_rect(center=(SCREEN_WIDTH // 2 + 4, 120 + 4))
             self.screen.blit(title_shadow, shadow_rect)
             # Main title
-            pulse_offset = int(5 * abs(((self.pulse_timer % 60) / 60.0) * 2 - 1))
-            title_color_pulsed = (
-                min(255, self.title_color[0] + pulse_offset),
-                min(255, self.title_color[1] + pulse_offset),
-                min(255, self.title_color[2] + pulse_offset)
-            )
-            title = self.title_font.render(title_text, True, title_color_pulsed)
+            pulse_offset = self.pulse_offsets[self.pulse_timer % 60]
+            title = self.pulsed_titles.get(pulse_offset)
+            if title is None:
+                title_color_pulsed = (
+                    min(255, self.title_color[0] + pulse_offset),
+                    min(255, self.title_color[1] + pulse_offset),
+                    min(255, self.title_color[2] + pulse_offset)
+                )
+                title = convert_surface(self.title_font.render(title_text, True, title_color_pulsed))
+                self.pulsed_titles[pulse_offset] = title
             title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 120))
             self.screen.blit(title, title_rect)
 
             # Subtitle
-            subtitle = self.font.render("A Retro Adventure", True, self.menu_color)
+            subtitle = render_menu_text(self.font, "A Retro Adventure", self.menu_color)
             subtitle_rect = subtitle.get_rect(center=(SCREEN_WIDTH // 2, 180))
             self.screen.blit(subtitle, subtitle_rect)
 
@@ -1289,19 +1660,19 @@ class TitleScreen:
                 color = self.selected_color
                 # Draw selection indicator
                 indicator = "> "
-                indicator_text = self.large_font.render(indicator, True, color)
+                indicator_text = render_menu_text(self.large_font, indicator, color)
                 indicator_rect = indicator_text.get_rect(center=(SCREEN_WIDTH // 2 - 100, menu_start_y + i * menu_spacing))
                 self.screen.blit(indicator_text, indicator_rect)
             else:
                 color = self.menu_color
 
             # Draw menu item
-            text = self.large_font.render(item, True, color)
+            text = render_menu_text(self.large_font, item, color)
             text_rect = text.get_rect(center=(SCREEN_WIDTH // 2, menu_start_y + i * menu_spacing))
             self.screen.blit(text, text_rect)
 
         # Instructions at bottom
-        instructions = self.font.render("Use Arrow Keys or W/S to navigate, Enter/Space to select", True, (150, 150, 150))
+        instructions = render_menu_text(self.font, "Use Arrow Keys or W/S to navigate, Enter/Space to select", (150, 150, 150))
         instructions_rect = instructions.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 50))
         self.screen.blit(instructions, instructions_rect)
 
@@ -1318,6 +1689,7 @@ class HighScoresScreen:
         self.title_color = (220, 180, 100)  # Gold
         self.text_color = (200, 200, 200)   # Light gray
         self.bg_color = (20, 10, 30)  # Dark purple
+        self.background = render_menu_background(self.bg_color)
 
     def handle_input(self, event) -> Optional[str]:
         """Handle input, returns action or None"""
@@ -1326,19 +1698,17 @@ class HighScoresScreen:
                 return "back"
         return None
 
+    def frame_key(self):
+        """Everything draw() depends on, so an unchanged key means an unchanged frame"""
+        return tuple(self.high_score_manager.get_scores())
+
     def draw(self):
         """Draw the high scores screen"""
         # Background
-        self.screen.fill(self.bg_color)
-
-        # Draw decorative elements
-        for i in range(0, SCREEN_WIDTH, 40):
-            for j in range(0, SCREEN_HEIGHT, 40):
-                if (i + j) % 80 == 0:
-                    pygame.draw.rect(self.screen, (30, 20, 40), (i, j, 20, 20))
+        self.screen.blit(self.background, (0, 0))
 
         # Title
-        title = self.title_font.render("HIGH SCORES", True, self.title_color)
+        title = render_menu_text(self.title_font, "HIGH SCORES", self.title_color)
         title_rect = title.get_rect(center=(SCREEN_WIDTH // 2, 80))
         self.screen.blit(title, title_rect)
 
@@ -1349,12 +1719,12 @@ class HighScoresScreen:
 
         if not scores:
             # No scores yet
-            no_scores_text = self.large_font.render("No high scores yet!", True, self.text_color)
+            no_scores_text = render_menu_text(self.large_font, "No high scores yet!", self.text_color)
             no_scores_rect = no_scores_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2))
             self.screen.blit(no_scores_text, no_scores_rect)
         else:
             # Draw header
-            header = self.font.render("RANK    NAME                SCORE", True, (150, 150, 100))
+            header = render_menu_text(self.font, "RANK    NAME                SCORE", (150, 150, 100))
             header_rect = header.get_rect(center=(SCREEN_WIDTH // 2, start_y - 40))
             self.screen.blit(header, header_rect)
 
@@ -1380,15 +1750,28 @@ class HighScoresScreen:
                     color = self.text_color
 
                 full_text = f"{rank_text}  {name_text}  {score_text}"
-                text_surface = self.large_font.render(full_text, True, color)
+                text_surface = render_menu_text(self.large_font, full_text, color)
                 text_rect = text_surface.get_rect(center=(SCREEN_WIDTH // 2, start_y + i * spacing))
                 self.screen.blit(text_surface, text_rect)
 
         # Instructions at bottom
-        instructions = self.font.render("Press ESC, Enter, or Space to return", True, (150, 150, 150))
+        instructions = render_menu_text(self.font, "Press ESC, Enter, or Space to return", (150, 150, 150))
         instructions_rect = instructions.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 50))
         self.screen.blit(instructions, instructions_rect)
 
+_NON_DIGITS = re.compile(r'\D+')
+
+def level_number(path: Path) -> int:
+    """Sort key for level files: every digit in the file name read as one number (0 if none)"""
+    return int(_NON_DIGITS.sub('', path.stem) or 0)
+
+class HeldKeys(set):
+    """Key codes currently held down, kept up to date from KEYDOWN/KEYUP events.
+
+    Indexing by key code works like the sequence from pygame.key.get_pressed().
+    """
+    __getitem__ = set.__contains__
+
 class Game:
     def __init__(self):
         self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
@@ -1402,9 +1785,56 @@ class Game:
         self.small_font = pygame.font.Font(None, 18)
         self.large_font = pygame.font.Font(None, 48)
 
+        # HUD text rendered once and reused until its string changes, keyed by HUD slot
+        self._hud_text: Dict[str, Tuple[str, pygame.Surface]] = {}
+        # The controls hint never changes, so render its lines up front
+        controls = [
+            "Arrow Keys/WASD: Move",
+            "Up: Jump",
+            "Space: Attack",
+            "R: Restart Level",
+            "N: Next Level",
+            "ESC: Quit"
+        ]
+        lines = [self.small_font.render(control, True, WHITE) for control in controls]
+        # Composite them into one transparent surface so draw_ui needs a single blit.
+        # The lines don't overlap, so BLEND_RGBA_MAX copies each one in unchanged
+        self._controls_surface = pygame.Surface(
+            (max(line.get_width() for line in lines), len(lines) * 20), pygame.SRCALPHA)
+        for i, line in enumerate(lines):
+            self._controls_surface.blit(line, (0, i * 20), special_flags=pygame.BLEND_RGBA_MAX)
+        self._controls_surface = convert_surface(self._controls_surface)
+        self._controls_pos = (10, SCREEN_HEIGHT - len(lines) * 20 - 10)
+
+        # Fixed parts of the game-over screen, as (surface, rect) pairs
+        self._game_over_overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
+        self._game_over_overlay.set_alpha(200)
+        self._game_over_overlay.fill(BLACK)
+        game_over_text = self.large_font.render("GAME OVER", True, RED)
+        self._game_over_title = (game_over_text,
+                                 game_over_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 100)))
+        high_score_text = self.font.render("NEW HIGH SCORE!", True, (255, 215, 0))
+        self._game_over_high_score = (high_score_text,
+                                      high_score_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 10)))
+        menu_text = self.font.render("Press ENTER to return to menu", True, WHITE)
+        quit_text = self.font.render("Press ESC to Quit", True, WHITE)
+        self._game_over_instructions = [
+            (menu_text, menu_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 60))),
+            (quit_text, quit_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 90))),
+        ]
+
+        # Held keys, tracked from the event queue instead of polled each frame
+        self.held_keys = HeldKeys()
+
         # Game state - start at title screen
         self.state = GameState.TITLE
         self.game_over = False
+        self._game_over_frame_drawn = False
+        self._menu_frame_key = None  # (state, screen.frame_key()) of the menu frame on screen
+        self._viewport_surface: Optional[pygame.Surface] = None  # Reused by draw_playing
+        # Set when a level is started or switched, so the time spent loading it
+        # isn't simulated as a burst of catch-up steps on the next frame
+        self._level_switched = False
 
         # High score management
         self.high_score_manager = HighScoreManager()
@@ -1436,7 +1866,10 @@ class Game:
         else:
             spawn_x = 100
             spawn_y = 100
-        self.player = Player(spawn_x, spawn_y)
+        if self.player:
+            self.player.reset(spawn_x, spawn_y)  # Reuse the already-built sprite frames
+        else:
+            self.player = Player(spawn_x, spawn_y)
 
     def set_camera_to_player(self):
         """Position camera based on player spawn and viewport trigger."""
@@ -1446,10 +1879,8 @@ class Game:
         player_feet_y = self.player.y + self.player.height
         target_x = self.player.x + self.player.width // 2 - viewport_width // 2
         target_y = player_feet_y - trigger_y
-        max_camera_x = max(0, self.level.width * TILE_SIZE - viewport_width)
-        max_camera_y = max(0, self.level.height * TILE_SIZE - viewport_height)
-        self.camera_x = max(0, min(target_x, max_camera_x))
-        self.camera_y = max(0, min(target_y, max_camera_y))
+        self.camera_x = max(0, min(target_x, self.level.max_camera_x))
+        self.camera_y = max(0, min(target_y, self.level.max_camera_y))
     
     def start_run(self):
         """Start a new game run"""
@@ -1469,6 +1900,7 @@ class Game:
         self.set_camera_to_player()
         self.game_over = False
         self.total_score = 0
+        self._level_switched = True
 
         # Switch to playing state
         self.state = GameState.PLAYING
@@ -1482,13 +1914,14 @@ class Game:
         self.set_camera_to_player()
         self.game_over = False
         self.total_score = 0
+        self._level_switched = True
         self.test_mode = True
         self.state = GameState.PLAYING
 
     def load_all_levels(self):
         """Load all level JSON files from current directory in numerical order"""
         levels = []
-        level_files = sorted(Path('.').glob('level*.json'), key=lambda p: int(''.join(filter(str.isdigit, p.stem)) or 0))
+        level_files = sorted(Path('.').glob('level*.json'), key=level_number)
 
         for filepath in level_files:
             try:
@@ -1511,49 +1944,41 @@ class Game:
         target_y = self.camera_y
         player_feet_y = self.player.y + self.player.height
         player_feet_screen_y = player_feet_y - self.camera_y
-        min_fraction = max(0.0, CAMERA_VERTICAL_TRIGGER_FRACTION - CAMERA_VERTICAL_DEADZONE_UP_FRACTION)
-        max_fraction = min(1.0, CAMERA_VERTICAL_TRIGGER_FRACTION + CAMERA_VERTICAL_DEADZONE_DOWN_FRACTION)
-        min_screen_y = viewport_height * min_fraction
-        max_screen_y = viewport_height * max_fraction
+        min_screen_y = viewport_height * CAMERA_MIN_SCREEN_FRACTION
+        max_screen_y = viewport_height * CAMERA_MAX_SCREEN_FRACTION
         if player_feet_screen_y < min_screen_y:
             target_y = player_feet_y - min_screen_y
         elif player_feet_screen_y > max_screen_y:
             target_y = player_feet_y - max_screen_y
 
         # Clamp camera to level bounds
-        max_camera_x = max(0, self.level.width * TILE_SIZE - viewport_width)
-        max_camera_y = max(0, self.level.height * TILE_SIZE - viewport_height)
-
-        self.camera_x = max(0, min(target_x, max_camera_x))
-        self.camera_y = max(0, min(target_y, max_camera_y))
+        self.camera_x = max(0, min(target_x, self.level.max_camera_x))
+        self.camera_y = max(0, min(target_y, self.level.max_camera_y))
 
     def check_enemy_collisions(self):
         """Check for player-enemy collisions"""
-        player_rect = self.player.get_rect()
+        player = self.player
+        player_rect = player.get_rect()
+        # Broad phase: enemies this far from the player's left edge can't overlap it
+        reach = max(player_rect.width, TILE_SIZE) + 1
 
         for enemy in self.level.enemies:
-            if not enemy.alive:
+            if not enemy.alive or abs(enemy.x - player_rect.x) > reach:
                 continue
 
             enemy_rect = enemy.get_rect()
             if player_rect.colliderect(enemy_rect):
                 # Player takes damage
-                self.player.health -= enemy.enemy_type.damage
-                if self.player.health < 0:
-                    self.player.health = 0
+                player.health = max(0, player.health - enemy.enemy_type.damage)
 
-                # Knockback player
-                dx = self.player.x - enemy.x
-                if dx > 0:
-                    self.player.x += 10  # Push right
-                else:
-                    self.player.x -= 10  # Push left
+                # Knockback player away from the enemy (left when level with it)
+                player.x += 10 if player.x > enemy.x else -10
 
     def check_collectible_collisions(self):
         """Check for player-collectible collisions"""
         player_rect = self.player.get_rect()
 
-        for collectible in self.level.collectibles:
+        for collectible in self.level.collectibles_near(player_rect):
             if collectible.collected:
                 continue
 
@@ -1564,6 +1989,7 @@ class Game:
                 # Track required collectibles
                 if collectible.collectible_type.required:
                     self.level.required_collectibles_collected += 1
+                    self.level.update_requirements_met()
 
                 # Apply collectible effect
                 if collectible.collectible_type.effect == CollectibleEffect.HEALTH.value:
@@ -1583,9 +2009,11 @@ class Game:
             return
 
         attack_rect = self.player.get_attack_rect()
+        # Same broad phase as check_enemy_collisions, against the sword's hitbox
+        reach = max(attack_rect.width, TILE_SIZE) + 1
 
         for enemy in self.level.enemies:
-            if not enemy.alive:
+            if not enemy.alive or abs(enemy.x - attack_rect.x) > reach:
                 continue
 
             enemy_rect = enemy.get_rect()
@@ -1600,6 +2028,7 @@ class Game:
                 # Track required enemy kills
                 if was_alive and was_required and not enemy.alive:
                     self.level.required_enemies_killed += 1
+                    self.level.update_requirements_met()
                     print(f"Required enemy killed! ({self.level.required_enemies_killed}/{self.level.required_enemies_total})")
 
                 # Knockback enemy
@@ -1615,9 +2044,11 @@ class Game:
     def check_projectile_collisions(self):
         """Check if any projectiles hit the player"""
         player_rect = self.player.get_rect()
+        # Broad phase as in check_enemy_collisions; projectiles are smaller than the player
+        reach = player_rect.width + 1
 
         for projectile in self.level.projectiles:
-            if not projectile.active:
+            if not projectile.active or abs(projectile.x - player_rect.x) > reach:
                 continue
 
             projectile_rect = projectile.get_rect()
@@ -1643,15 +2074,7 @@ class Game:
         if not self.level.all_requirements_met():
             return False
 
-        player_rect = self.player.get_rect()
-        end_level_tiles = self.level.get_end_level_tiles()
-
-        for (tile_x, tile_y), tile in end_level_tiles:
-            tile_rect = pygame.Rect(tile_x * TILE_SIZE, tile_y * TILE_SIZE, TILE_SIZE, TILE_SIZE)
-            if player_rect.colliderect(tile_rect):
-                return True
-
-        return False
+        return self.player.get_rect().collidelist(self.level.end_level_rects) != -1
 
     def advance_level(self):
         """Advance to the next level or restart current level if no next level"""
@@ -1665,6 +2088,7 @@ class Game:
             # Move to next level
             self.current_level_index = next_level_index
             self.level = self.levels[self.current_level_index]
+            self._level_switched = True
             print(f"Level complete! Moving to level {self.current_level_index + 1}")
         else:
             # No more levels - game won! Save high score and return to menu
@@ -1692,8 +2116,7 @@ class Game:
             return
 
         # Death from falling off the bottom of the level
-        level_bottom = self.level.height * TILE_SIZE
-        if self.player.y > level_bottom:
+        if self.player.y > self.level.pixel_height:
             print("Player fell off the level!")
             self.game_over = True
             self.player.health = 0  # Set health to 0 for consistency
@@ -1706,15 +2129,10 @@ class Game:
     def draw_game_over(self):
         """Draw game over screen"""
         # Semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        overlay.set_alpha(200)
-        overlay.fill(BLACK)
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self._game_over_overlay, (0, 0))
 
         # Game Over text
-        game_over_text = self.large_font.render("GAME OVER", True, RED)
-        text_rect = game_over_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 100))
-        self.screen.blit(game_over_text, text_rect)
+        self.screen.blit(*self._game_over_title)
 
         # Show final score
         final_score = self.total_score
@@ -1724,18 +2142,11 @@ class Game:
 
         # Check if it's a high score
         if self.high_score_manager.is_high_score(final_score) and final_score > 0:
-            high_score_text = self.font.render("NEW HIGH SCORE!", True, (255, 215, 0))
-            hs_rect = high_score_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 10))
-            self.screen.blit(high_score_text, hs_rect)
+            self.screen.blit(*self._game_over_high_score)
 
         # Instructions
-        menu_text = self.font.render("Press ENTER to return to menu", True, WHITE)
-        menu_rect = menu_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 60))
-        self.screen.blit(menu_text, menu_rect)
-
-        quit_text = self.font.render("Press ESC to Quit", True, WHITE)
-        quit_rect = quit_text.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 90))
-        self.screen.blit(quit_text, quit_rect)
+        for text, rect in self._game_over_instructions:
+            self.screen.blit(text, rect)
 
     def draw_ui(self):
         """Draw UI elements"""
@@ -1756,36 +2167,33 @@ class Game:
         pygame.draw.rect(self.screen, WHITE, (bar_x, bar_y, bar_width, bar_height), 2)
         
         # Health text
-        health_text = self.small_font.render(f"HP: {self.player.health}/{self.player.max_health}", True, WHITE)
+        health_text = self.render_hud_text("health", f"HP: {self.player.health}/{self.player.max_health}", self.small_font)
         self.screen.blit(health_text, (bar_x + 5, bar_y + 2))
         
         # Level info
-        level_text = self.font.render(f"Level {self.current_level_index + 1}/{len(self.levels)}", True, WHITE)
+        level_text = self.render_hud_text("level", f"Level {self.current_level_index + 1}/{len(self.levels)}", self.font)
         self.screen.blit(level_text, (SCREEN_WIDTH - 200, 10))
 
         # Score (show total + current level)
         current_score = self.total_score + self.level.score
-        score_text = self.font.render(f"Score: {current_score}", True, WHITE)
+        score_text = self.render_hud_text("score", f"Score: {current_score}", self.font)
         self.screen.blit(score_text, (SCREEN_WIDTH - 200, 40))
 
         # Keys
-        keys_text = self.font.render(f"Keys: {self.level.keys_collected}", True, WHITE)
+        keys_text = self.render_hud_text("keys", f"Keys: {self.level.keys_collected}", self.font)
         self.screen.blit(keys_text, (SCREEN_WIDTH - 150, 70))
         
         # Controls hint
-        controls = [
-            "Arrow Keys/WASD: Move",
-            "Up: Jump",
-            "Space: Attack",
-            "R: Restart Level",
-            "N: Next Level",
-            "ESC: Quit"
-        ]
-        y = SCREEN_HEIGHT - len(controls) * 20 - 10
-        for control in controls:
-            text = self.small_font.render(control, True, WHITE)
-            self.screen.blit(text, (10, y))
-            y += 20
+        self.screen.blit(self._controls_surface, self._controls_pos)
+
+    def render_hud_text(self, slot: str, text: str, font: pygame.font.Font) -> pygame.Surface:
+        """Render white HUD text, reusing the last surface drawn in this slot if the text is unchanged"""
+        cached = self._hud_text.get(slot)
+        if cached and cached[0] == text:
+            return cached[1]
+        surface = convert_surface(font.render(text, True, WHITE))
+        self._hud_text[slot] = (text, surface)
+        return surface
     
     def next_level(self):
         """Load next level"""
@@ -1805,6 +2213,7 @@ class Game:
         self.spawn_player()
         self.set_camera_to_player()
         self.game_over = False
+        self._level_switched = True
         print("Level restarted")
     
     def handle_events(self):
@@ -1812,6 +2221,17 @@ class Game:
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 self.running = False
+            elif event.type == pygame.KEYDOWN:
+                self.held_keys.add(event.key)
+            elif event.type == pygame.KEYUP:
+                self.held_keys.discard(event.key)
+            elif event.type == pygame.WINDOWFOCUSLOST:
+                # Key releases while unfocused never arrive, so don't leave keys stuck down
+                self.held_keys.clear()
+            elif event.type == pygame.WINDOWEXPOSED:
+                # The window needs repainting, so kept game-over or menu frames must be redrawn
+                self._game_over_frame_drawn = False
+                self._menu_frame_key = None
 
             # Handle events based on current state
             if self.state == GameState.TITLE:
@@ -1845,81 +2265,126 @@ class Game:
                         if self.game_over:
                             self.state = GameState.TITLE
     
-    def run(self):
-        """Main game loop"""
-        while self.running:
-            self.handle_events()
-
-            # Update and draw based on current state
-            if self.state == GameState.TITLE:
-                self.title_screen.update()
-                self.title_screen.draw()
-
-            elif self.state == GameState.HIGH_SCORES:
-                self.high_scores_screen.draw()
-
-            elif self.state == GameState.PLAYING:
-                if not self.game_over:
-                    # Get input
-                    keys = pygame.key.get_pressed()
-
-                    # Update
-                    self.player.update(keys, self.level)
-
-                    # Update enemies and collect new projectiles
-                    for enemy in self.level.enemies:
-                        new_projectiles = enemy.update(self.player, self.level)
-                        self.level.projectiles.extend(new_projectiles)
+    def draw_playing(self):
+        """Draw the level, player and HUD (plus the game-over overlay) to the screen"""
+        # Draw game with viewport scaling for zoom effect
+        if self.level:
+            # Reuse a surface at viewport size (smaller = more zoomed in) while the size holds
+            viewport_size = (self.level.viewport_width, self.level.viewport_height)
+            viewport_surface = self._viewport_surface
+            if viewport_surface is None or viewport_surface.get_size() != viewport_size:
+                viewport_surface = self._viewport_surface = convert_surface(pygame.Surface(viewport_size))
+            viewport_surface.fill(BLACK)
+
+            # Draw level and player to viewport surface
+            self.level.draw(viewport_surface, self.camera_x, self.camera_y)
+            if self.player:
+                self.player.draw(viewport_surface, self.camera_x, self.camera_y)
+
+            # Scale viewport surface straight onto the screen, covering it (creates zoom effect)
+            pygame.transform.scale(viewport_surface, (SCREEN_WIDTH, SCREEN_HEIGHT), self.screen)
+
+            # Draw UI on top (not scaled)
+            if self.player:
+                self.draw_ui()
+        else:
+            self.screen.fill(BLACK)
 
-                    # Update projectiles
-                    for projectile in self.level.projectiles:
-                        projectile.update(self.level)
+        # Draw game over screen if player is dead
+        if self.game_over:
+            self.draw_game_over()
 
-                    # Remove inactive projectiles
-                    self.level.projectiles = [p for p in self.level.projectiles if p.active]
+    def update_playing(self, keys):
+        """Advance the game by one fixed 1/FPS step"""
+        # Update
+        self.player.update(keys, self.level)
 
-                    # Check collisions
-                    self.check_enemy_collisions()
-                    self.check_collectible_collisions()
-                    self.check_player_attack_collisions()
-                    self.check_projectile_collisions()
+        # Update enemies and collect new projectiles
+        self.level.update_enemies(self.player)
 
-                    # Check if player is dead
-                    self.check_player_death()
+        # Update projectiles
+        for projectile in self.level.projectiles:
+            projectile.update(self.level)
 
-                    # Check if player completed the level
-                    if self.check_end_level_collision():
-                        self.advance_level()
+        # Remove inactive projectiles
+        self.level.projectiles = [p for p in self.level.projectiles if p.active]
 
-                    self.update_camera()
+        # Check collisions
+        self.check_enemy_collisions()
+        self.check_collectible_collisions()
+        self.check_player_attack_collisions()
+        self.check_projectile_collisions()
 
-                # Draw game with viewport scaling for zoom effect
-                self.screen.fill(BLACK)
+        # Check if player is dead
+        self.check_player_death()
 
-                if self.level:
-                    # Create a surface at viewport size (smaller = more zoomed in)
-                    viewport_surface = pygame.Surface((self.level.viewport_width, self.level.viewport_height))
-                    viewport_surface.fill(BLACK)
+        # Check if player completed the level
+        if self.check_end_level_collision():
+            self.advance_level()
 
-                    # Draw level and player to viewport surface
-                    self.level.draw(viewport_surface, self.camera_x, self.camera_y)
-                    if self.player:
-                        self.player.draw(viewport_surface, self.camera_x, self.camera_y)
+        self.update_camera()
 
-                    # Scale viewport surface to fill the screen (creates zoom effect)
-                    scaled_surface = pygame.transform.scale(viewport_surface, (SCREEN_WIDTH, SCREEN_HEIGHT))
-                    self.screen.blit(scaled_surface, (0, 0))
+    def run(self):
+        """Main game loop"""
+        # Physics runs in fixed 1/FPS steps paid for by real elapsed time, so a slow
+        # frame is caught up on instead of slowing the whole game down. Starting
+        # half a step in keeps tick() jitter from alternating 0 and 2 steps a frame.
+        step_ms = 1000 / FPS
+        accumulator = step_ms / 2
 
-                    # Draw UI on top (not scaled)
-                    if self.player:
-                        self.draw_ui()
+        while self.running:
+            self.handle_events()
+            frame_changed = True
 
-                # Draw game over screen if player is dead
-                if self.game_over:
-                    self.draw_game_over()
+            # Update and draw based on current state
+            if self.state in (GameState.TITLE, GameState.HIGH_SCORES):
+                if self.state == GameState.TITLE:
+                    self.title_screen.update()
+                    menu_screen = self.title_screen
+                else:
+                    menu_screen = self.high_scores_screen
+
+                # Menus are static apart from the selection and the title pulse, so
+                # a frame is only redrawn and presented when one of those changed
+                frame_key = (self.state, menu_screen.frame_key())
+                if frame_key != self._menu_frame_key:
+                    menu_screen.draw()
+                    self._menu_frame_key = frame_key
+                else:
+                    frame_changed = False
 
-            pygame.display.flip()
-            self.clock.tick(FPS)
+            elif self.state == GameState.PLAYING:
+                self._menu_frame_key = None  # The menu frame is about to be drawn over
+                steps = 0
+                while (accumulator >= step_ms and steps < MAX_UPDATES_PER_FRAME
+                       and self.state == GameState.PLAYING and not self.game_over
+                       and not self._level_switched):
+                    self.update_playing(self.held_keys)
+                    accumulator -= step_ms
+                    steps += 1
+                if steps == MAX_UPDATES_PER_FRAME and accumulator >= step_ms:
+                    accumulator = step_ms / 2  # Too far behind to catch up; drop the backlog
+
+                # Once the game-over overlay is up nothing moves, so that frame is left on
+                # screen and doesn't need presenting again
+                if not (self.game_over and self._game_over_frame_drawn):
+                    self.draw_playing()
+                    self._game_over_frame_drawn = self.game_over
+                else:
+                    frame_changed = False
+
+            # The zoomed viewport covers the whole screen and scrolls with the camera, and
+            # a menu only redraws when its pulse or contents change, so a changed frame
+            # is always presented in full
+            if frame_changed:
+                pygame.display.flip()
+            elapsed = self.clock.tick(FPS)
+            if self.state == GameState.PLAYING and not self.game_over and not self._level_switched:
+                accumulator += elapsed
+            else:
+                # Time spent outside play, or loading the level just started, doesn't count
+                accumulator = step_ms / 2
+            self._level_switched = False
 
         pygame.quit()
 